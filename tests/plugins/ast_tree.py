@@ -1,10 +1,15 @@
 import ast
+from functools import lru_cache
 from textwrap import dedent
+from typing import Final
 
 import pytest
 
 from wemake_python_styleguide.transformations.ast_tree import transform
 
+#: How many parsed trees we keep for later reuse.
+_PARSED_TREES_CACHE_SIZE: Final = 4096
+
 
 @pytest.fixture(scope='session')
 def parse_ast_tree(compile_code):
@@ -21,8 +26,13 @@ def parse_ast_tree(compile_code):
     But in case it is impossible to do, you can reinvent it.
 
     Order is important.
+
+    Parsed trees are cached by the source code,
+    because the same snippets are parsed in many parametrized tests.
+    Visitors do not mutate trees, so it is safe to share them.
     """
 
+    @lru_cache(maxsize=_PARSED_TREES_CACHE_SIZE)
     def factory(code: str, *, do_compile: bool = True) -> ast.AST:
         code_to_parse = dedent(code)
         if do_compile:
@@ -1,15 +1,26 @@
 import io
 import tokenize
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
+from typing import Final
 
 import pytest
 
+#: How many parsed token lists we keep for later reuse.
+_PARSED_TOKENS_CACHE_SIZE: Final = 4096
+
 
 @pytest.fixture(scope='session')
 def parse_tokens(compile_code):
-    """Parses tokens from a string."""
+    """
+    Parses tokens from a string.
+
+    Tokens are cached by the source code, the same way as trees are.
+    Visitors do not mutate tokens, so it is safe to share them.
+    """
 
+    @lru_cache(maxsize=_PARSED_TOKENS_CACHE_SIZE)
     def factory(
         code: str,
         *,
@@ -0,0 +1,20 @@
+import pytest
+
+from wemake_python_styleguide.logic.source import node_to_string
+
+
+@pytest.mark.parametrize(
+    ('code', 'expected'),
+    [
+        ('some.attribute', 'some.attribute'),
+        ('call(1,  2)', 'call(1, 2)'),
+        ('first   +second', 'first + second'),
+    ],
+)
+def test_node_to_string_is_cached(parse_ast_tree, code, expected):
+    """Ensures that rendered source code is cached on a node."""
+    node = parse_ast_tree(code).body[0].value
+
+    assert node_to_string(node) == expected
+    assert node.wps_source == expected
+    assert node_to_string(node) is node.wps_source
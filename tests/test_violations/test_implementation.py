@@ -39,3 +39,9 @@ def test_violation_must_have_docstring():
 
         class IShallNotPass(ASTViolation):  # noqa: WPS431
             code = 123
+
+
+def test_violations_define_slots(all_violations):
+    """Ensures that all violations define ``__slots__``."""
+    for violation_class in all_violations:
+        assert '__slots__' in violation_class.__dict__, violation_class
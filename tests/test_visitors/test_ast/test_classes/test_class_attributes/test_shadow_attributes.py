@@ -42,16 +42,17 @@ class ClassWithAttrs:
         self.{1} = 2
 """
 
-class_attribute_annotated = """
+class_with_unrelated_decorator1 = """
+@not_a_dataclass
 class ClassWithAttrs:
     {0}: int = 0
 
-    def __init__(self) -> None:
+    def __post_init__(self) -> None:
         self.{1} = 2
 """
 
-class_with_unrelated_decorator1 = """
-@not_a_dataclass
+class_with_unrelated_decorator2 = """
+@not_dataclasses[0]
 class ClassWithAttrs:
     {0}: int = 0
 
@@ -59,8 +60,17 @@ class ClassWithAttrs:
         self.{1} = 2
 """
 
-class_with_unrelated_decorator2 = """
-@not_dataclasses[0]
+class_with_unrelated_decorator3 = """
+@not_dataclasses.dataclass
+class ClassWithAttrs:
+    {0}: int = 0
+
+    def __post_init__(self) -> None:
+        self.{1} = 2
+"""
+
+class_with_unrelated_decorator4 = """
+@some.decorator
 class ClassWithAttrs:
     {0}: int = 0
 
@@ -136,6 +146,24 @@ class ClassWithAttrs:
         self.{1} = 2
 """
 
+class_with_dataclass_decorator3 = """
+@attr.s(slots=True)
+class ClassWithAttrs:
+    {0}: int = 0
+
+    def __post_init__(self) -> None:
+        self.{1} = 2
+"""
+
+class_with_nested_class = """
+class ClassWithAttrs:
+    {0} = 0
+
+    class Nested:
+        def __init__(self) -> None:
+            self.{1} = 2
+"""
+
 regular_assigns = """
 {0} = 0
 {1} = 2
@@ -148,10 +176,11 @@ regular_assigns = """
         class_attribute,
         class_annotated_attribute,
         class_attribute_runtime,
-        class_attribute_annotated,
         class_attribute_logic,
         class_with_unrelated_decorator1,
         class_with_unrelated_decorator2,
+        class_with_unrelated_decorator3,
+        class_with_unrelated_decorator4,
     ],
 )
 @pytest.mark.parametrize(
@@ -186,7 +215,6 @@ def test_incorrect_fields(
         class_attribute,
         class_annotated_attribute,
         class_attribute_runtime,
-        class_attribute_annotated,
         class_annotation,
         class_complex_attribute,
         class_complex_attribute_annotated,
@@ -196,8 +224,10 @@ def test_incorrect_fields(
         class_attribute_with_other,
         class_with_unrelated_decorator1,
         class_with_unrelated_decorator2,
+        class_with_unrelated_decorator3,
         class_with_dataclass_decorator1,
         class_with_dataclass_decorator2,
+        class_with_dataclass_decorator3,
         regular_assigns,
     ],
 )
@@ -237,6 +267,8 @@ def test_correct_fields(
         class_complex_attribute_annotated,
         class_with_dataclass_decorator1,
         class_with_dataclass_decorator2,
+        class_with_dataclass_decorator3,
+        class_with_nested_class,
     ],
 )
 @pytest.mark.parametrize(
@@ -262,3 +294,27 @@ def test_safe_fields(
     visitor.run()
 
     assert_errors(visitor, [])
+
+
+@pytest.mark.parametrize(
+    ('code', 'dataclass_like_decorators'),
+    [
+        (class_with_unrelated_decorator1, ('not_a_dataclass',)),
+        (class_with_unrelated_decorator3, ('not_dataclasses.dataclass',)),
+    ],
+)
+def test_dataclass_like_decorators(
+    assert_errors,
+    parse_ast_tree,
+    options,
+    code,
+    dataclass_like_decorators,
+):
+    """Testing that configured decorators allow shadowing."""
+    tree = parse_ast_tree(code.format('field1', 'field1'))
+
+    option_values = options(dataclass_like_decorators=dataclass_like_decorators)
+    visitor = ClassAttributeVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [])
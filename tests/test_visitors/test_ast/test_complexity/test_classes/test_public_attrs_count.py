@@ -36,6 +36,16 @@ class Test:
         {1}
 """
 
+not_a_dataclass_attribute_template = """
+@some.decorator
+class Test:
+    def __init__(self):
+        {0}
+
+    def other(self):
+        {1}
+"""
+
 module_template = """
 {0}
 {1}
@@ -101,6 +111,7 @@ def test_correct_attributes(
     [
         class_template,
         not_a_dataclass_template,
+        not_a_dataclass_attribute_template,
     ],
 )
 @pytest.mark.parametrize(
@@ -164,3 +175,35 @@ def test_attributes_outside_class(
     visitor.run()
 
     assert_errors(visitor, [])
+
+
+@pytest.mark.parametrize(
+    ('decorator', 'dataclass_like_decorators'),
+    [
+        ('my_model', ('my_model',)),
+        ('models.model', ('models.model',)),
+        ('models.model()', ('models.model',)),
+    ],
+)
+def test_dataclass_like_decorators(
+    assert_errors,
+    parse_ast_tree,
+    decorator,
+    dataclass_like_decorators,
+    options,
+    mode,
+):
+    """Testing that configured decorators allow any amount of attributes."""
+    code = not_a_dataclass_template.replace('not_a_dataclass', decorator)
+    tree = parse_ast_tree(
+        mode(code.format('self.public = 1', 'self.other = 1')),
+    )
+
+    option_values = options(
+        max_attributes=1,
+        dataclass_like_decorators=dataclass_like_decorators,
+    )
+    visitor = ClassComplexityVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [])
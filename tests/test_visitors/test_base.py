@@ -1,7 +1,16 @@
+import ast
+import tokenize
 from unittest.mock import MagicMock
 
+import pytest
+
 from wemake_python_styleguide import constants
-from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors.base import (
+    BaseFilenameVisitor,
+    BaseNodeVisitor,
+    BaseTokenVisitor,
+)
 
 
 class _TestingFilenameVisitor(BaseFilenameVisitor):
@@ -19,3 +28,79 @@ def test_base_filename_run_do_not_call_visit(default_options):
     instance.run()
 
     instance.visit_filename.assert_not_called()
+
+
+class _TestingNodeVisitor(BaseNodeVisitor):
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        """Overridden to handle some node type."""
+        self.generic_visit(node)
+
+
+class _TestingPostVisitor(_TestingNodeVisitor):
+    def _post_visit(self) -> None:
+        """Overridden to make sure that all post hooks are executed."""
+
+
+@pytest.mark.parametrize(
+    ('visitor_class', 'code', 'is_applicable'),
+    [
+        (_TestingNodeVisitor, 'class Some: ...', True),
+        (_TestingNodeVisitor, 'def some(): ...', False),
+        (_TestingPostVisitor, 'class Some: ...', True),
+        (_TestingPostVisitor, 'def some(): ...', True),
+    ],
+)
+def test_base_node_visitor_is_applicable(
+    default_options,
+    visitor_class,
+    code,
+    is_applicable,
+):
+    """Ensures that visitors without handlers for present nodes are skipped."""
+    Checker.parse_options(default_options)
+    checker = Checker(tree=ast.parse(code), file_tokens=[])
+
+    assert visitor_class.is_applicable(checker) is is_applicable
+
+
+class _TestingOrderVisitor(BaseNodeVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.visited: list[str] = []
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        """Overridden to record the visiting order."""
+        self.visited.append(node.id)
+        self.generic_visit(node)
+
+
+def test_base_node_visitor_order(default_options):
+    """Ensures that nodes without handlers do not change the visiting order."""
+    tree = ast.parse('first(second + third[fourth], key=fifth)')
+    visitor = _TestingOrderVisitor(default_options, tree=tree)
+    visitor.run()
+
+    assert visitor.visited == ['first', 'second', 'third', 'fourth', 'fifth']
+
+
+class _TestingTokenVisitor(BaseTokenVisitor):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.visited: list[str] = []
+
+    def visit_name(self, token: tokenize.TokenInfo) -> None:
+        """Overridden to record visited names."""
+        self.visited.append(token.string)
+
+    def visit_plus(self, token: tokenize.TokenInfo) -> None:
+        """Overridden to record visited exact types."""
+        self.visited.append(token.string)
+
+
+def test_base_token_visitor_routing(parse_tokens, default_options):
+    """Ensures that tokens are routed by their exact type."""
+    tokens = parse_tokens('first + second - third')
+    visitor = _TestingTokenVisitor(default_options, file_tokens=tokens)
+    visitor.run()
+
+    assert visitor.visited == ['first', '+', 'second', 'third']
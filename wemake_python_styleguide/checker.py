@@ -46,6 +46,7 @@ from flake8.options.manager import OptionManager
 
 from wemake_python_styleguide import constants, types
 from wemake_python_styleguide import version as pkg_version
+from wemake_python_styleguide.compat.routing import get_tree_routes
 from wemake_python_styleguide.options.config import Configuration
 from wemake_python_styleguide.options.validation import validate_options
 from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
@@ -79,6 +80,8 @@ class Checker:
         :class:`wemake_python_styleguide.options.validation.ValidatedOptions`.
 
         visitors: :term:`preset` of visitors that are run by this checker.
+        tree_routes: names of all node types that are present in the tree,
+        visitors that do not handle any of them are skipped.
 
     """
 
@@ -117,6 +120,7 @@ class Checker:
 
         """
         self.tree = transform(tree)
+        self.tree_routes = get_tree_routes(self.tree)
         self.filename = filename
         self.file_tokens = file_tokens
 
@@ -151,6 +155,9 @@ class Checker:
 
         """
         for visitor_class in self._visitors:
+            if not visitor_class.is_applicable(self):
+                continue
+
             visitor = visitor_class.from_checker(self)
 
             try:
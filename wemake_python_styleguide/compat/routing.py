@@ -1,6 +1,11 @@
 import ast
 import types
-from typing import Final
+from collections.abc import Callable
+from functools import cache
+from typing import Final, TypeAlias
+
+#: Function that handles a node when it is called with a visitor and a node.
+_RouteMethod: TypeAlias = Callable[[ast.NodeVisitor, ast.AST], None]
 
 #: That's how python types and ast types map to each other, copied from ast.
 _CONST_NODE_TYPE_NAMES: Final = types.MappingProxyType(
@@ -17,21 +22,76 @@ _CONST_NODE_TYPE_NAMES: Final = types.MappingProxyType(
 )
 
 
+def get_route_name(node: ast.AST) -> str | None:
+    """
+    Returns the name which is used to route ``visit_`` calls for a node.
+
+    Constants are routed by the type of their value, just like in python3.7.
+    """
+    return _get_key_route_name(get_route_key(node))
+
+
+def get_route_key(node: ast.AST) -> type:
+    """
+    Returns the type which is used to route ``visit_`` calls for a node.
+
+    It is the type of a node itself for all nodes except constants.
+    """
+    node_type = type(node)
+    if node_type is ast.Constant:
+        # That's the hack itself, we don't get the type of the node.
+        # We get the type of wrapped value from it.
+        return type(node.value)  # type: ignore[attr-defined]
+    return node_type
+
+
+def get_tree_routes(tree: ast.AST) -> frozenset[str | None]:
+    """Returns all route names that are present in the given tree."""
+    return frozenset(map(get_route_name, ast.walk(tree)))
+
+
+def get_route_method(
+    self: ast.NodeVisitor,
+    node: ast.AST,
+) -> _RouteMethod | None:
+    """
+    Returns ``visit_`` function that handles the given node if it exists.
+
+    Returned function is not bound, because we look it up on a class.
+    All lookups are cached per visitor class and route key.
+    So, we do not build method names and do not call ``getattr``
+    for each visited node.
+    """
+    visitor_class: type = type(self)
+    return _find_route_method(visitor_class, get_route_key(node))
+
+
 def route_visit(self: ast.NodeVisitor, node: ast.AST) -> None:
     """
     Custom router for python3.8+ release.
 
     Hacked to make sure that everything we had defined before is working.
     """
-    if isinstance(node, ast.Constant):
-        # That's the hack itself, we don't get the name of the node.
-        # We get the name of wrapped type from it.
-        type_name = _CONST_NODE_TYPE_NAMES.get(type(node.value))
+    route_method = get_route_method(self, node)
+    if route_method is None:
+        self.generic_visit(node)
     else:
-        type_name = node.__class__.__name__
+        route_method(self, node)
+
+
+def _get_key_route_name(route_key: type) -> str | None:
+    if issubclass(route_key, ast.AST):
+        return route_key.__name__
+    return _CONST_NODE_TYPE_NAMES.get(route_key)
+
 
-    return getattr(  # type: ignore[no-any-return]
-        self,
-        f'visit_{type_name}',
-        self.generic_visit,
-    )(node)
+@cache
+def _find_route_method(
+    visitor_class: type,
+    route_key: type,
+) -> _RouteMethod | None:
+    return getattr(
+        visitor_class,
+        f'visit_{_get_key_route_name(route_key)}',
+        None,
+    )
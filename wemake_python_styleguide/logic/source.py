@@ -4,8 +4,18 @@ from wemake_python_styleguide.types import AnyTextPrimitive
 
 
 def node_to_string(node: ast.AST) -> str:
-    """Returns the source code by doing ``ast`` to string convert."""
-    return ast.unparse(node).strip()
+    """
+    Returns the source code by doing ``ast`` to string convert.
+
+    The same nodes are rendered by many visitors,
+    so the result is cached on a node itself.
+    We use ``wps_`` prefix for the same reason as ``wps_parent`` does.
+    """
+    source_code: str | None = getattr(node, 'wps_source', None)
+    if source_code is None:
+        source_code = ast.unparse(node).strip()
+        setattr(node, 'wps_source', source_code)  # noqa: B010
+    return source_code
 
 
 def render_string(text_data: AnyTextPrimitive) -> str:
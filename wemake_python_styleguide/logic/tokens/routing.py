@@ -0,0 +1,23 @@
+import tokenize
+from collections.abc import Callable
+from functools import cache
+from typing import TypeAlias
+
+#: Function that handles a token when it is called with a visitor and a token.
+_TokenRouteMethod: TypeAlias = Callable[[object, tokenize.TokenInfo], None]
+
+
+@cache
+def get_token_route_method(
+    visitor_class: type,
+    exact_type: int,
+) -> _TokenRouteMethod | None:
+    """
+    Returns ``visit_`` function that handles the given token type if it exists.
+
+    Tokens are routed by the lowercase name of their ``.exact_type``.
+    Returned function is not bound, because we look it up on a class.
+    Lookups are cached, so we do not build method names for each token.
+    """
+    token_name = tokenize.tok_name[exact_type].lower()
+    return getattr(visitor_class, f'visit_{token_name}', None)
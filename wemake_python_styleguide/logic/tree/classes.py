@@ -1,9 +1,10 @@
 import ast
+from collections.abc import Set as AbstractSet
 from typing import Final, TypeAlias
 
 from wemake_python_styleguide.compat.aliases import AssignNodes
 from wemake_python_styleguide.constants import ALLOWED_BUILTIN_CLASSES
-from wemake_python_styleguide.logic import nodes, source
+from wemake_python_styleguide.logic import nodes, source, walk
 from wemake_python_styleguide.logic.naming.builtins import is_builtin_name
 from wemake_python_styleguide.types import AnyAssign
 
@@ -32,6 +33,9 @@ _SHORT_DATACLASS_NAMES: Final = frozenset(
     dataclass_name.split('.')[1] for dataclass_name in _DATACLASS_NAMES
 )
 
+#: Nested classes have their own attributes, lambdas cannot define any.
+_NESTED_SCOPES: Final = (ast.ClassDef, ast.Lambda)
+
 
 def is_forbidden_super_class(class_name: str | None) -> bool:
     """
@@ -63,28 +67,30 @@ def is_forbidden_super_class(class_name: str | None) -> bool:
     return is_builtin_name(class_name)
 
 
-def is_dataclass(node: ast.ClassDef) -> bool:
-    """Checks if some class is defined as a dataclass using popular libs."""
-    for decorator in node.decorator_list:
-        if isinstance(decorator, ast.Call):
-            decorator = decorator.func  # noqa: PLW2901
+def is_dataclass(
+    node: ast.ClassDef,
+    *,
+    extra_decorators: AbstractSet[str],
+) -> bool:
+    """
+    Checks if some class is defined as a dataclass using popular libs.
 
-        if not isinstance(decorator, ast.Name | ast.Attribute):
-            continue
+    Args:
+        node: class node definition.
+        extra_decorators: user-defined names of dataclass-like decorators.
 
-        decorator_code = source.node_to_string(decorator)
-        if (
-            decorator_code in _DATACLASS_NAMES
-            or decorator_code in _SHORT_DATACLASS_NAMES
-        ):
-            return True
-    return False
+    """
+    return any(
+        _is_dataclass_decorator(decorator, extra_decorators)
+        for decorator in node.decorator_list
+    )
 
 
 def get_attributes(
     node: ast.ClassDef,
     *,
     include_annotated: bool,
+    skip_nested: bool = False,
 ) -> _AllAttributes:
     """
     Helper to get all attributes from class nod definitions.
@@ -97,6 +103,7 @@ def get_attributes(
     Args:
         node: class node definition.
         include_annotated: whether or not to include AnnAssign attributes.
+        skip_nested: whether or not to skip nested classes and lambdas.
 
     Returns:
         A tuple of lists for both class and instance level variables.
@@ -105,7 +112,11 @@ def get_attributes(
     class_attributes = []
     instance_attributes = []
 
-    for subnode in ast.walk(node):
+    for subnode in (
+        walk.walk_skipping(node, _NESTED_SCOPES)
+        if skip_nested
+        else ast.walk(node)
+    ):
         instance_attr = get_instance_attribute(subnode)
         if instance_attr is not None:
             instance_attributes.append(instance_attr)
@@ -168,3 +179,28 @@ def _get_annotated_class_attribute(
         )
         else None
     )
+
+
+def _is_dataclass_decorator(
+    decorator: ast.expr,
+    extra_decorators: AbstractSet[str],
+) -> bool:
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+
+    # We first check the last name of a decorator, since it is cheap.
+    # Only then we render the full name of an attribute:
+    if isinstance(decorator, ast.Name):
+        return (
+            decorator.id in _SHORT_DATACLASS_NAMES
+            or decorator.id in extra_decorators
+        )
+    if not isinstance(decorator, ast.Attribute):
+        return False
+    if decorator.attr not in _SHORT_DATACLASS_NAMES and not extra_decorators:
+        return False
+
+    decorator_code = source.node_to_string(decorator)
+    return (
+        decorator_code in _DATACLASS_NAMES or decorator_code in extra_decorators
+    )
@@ -1,4 +1,5 @@
 import ast
+from collections import deque
 from collections.abc import Iterator
 from typing import TypeAlias, TypeVar
 
@@ -59,3 +60,21 @@ def get_subnodes_by_type(
     for child in ast.walk(node):
         if isinstance(child, subnodes_type):
             yield child
+
+
+def walk_skipping(
+    node: ast.AST,
+    skipped: _IsInstanceContainer,
+) -> Iterator[ast.AST]:
+    """
+    Works like :func:`ast.walk`, but does not go inside skipped subnodes.
+
+    Skipped subnodes themselves are still returned.
+    The given node is always walked, even if it has a skipped type.
+    """
+    nodes_to_walk = deque([node])
+    while nodes_to_walk:
+        subnode = nodes_to_walk.popleft()
+        if subnode is node or not isinstance(subnode, skipped):
+            nodes_to_walk.extend(ast.iter_child_nodes(subnode))
+        yield subnode
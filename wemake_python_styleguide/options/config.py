@@ -52,6 +52,9 @@ You can also show all options that ``flake8`` supports by running:
     :str:`wemake_python_styleguide.options.defaults.ALLOWED_MODULE_METADATA`
 - ``forbidden-module-metadata`` - list of forbidden module metadata, defaults to
     :str:`wemake_python_styleguide.options.defaults.FORBIDDEN_MODULE_METADATA`
+- ``dataclass-like-decorators`` - list of extra decorators
+    that define dataclass-like classes, defaults to
+    :str:`wemake_python_styleguide.options.defaults.DATACLASS_LIKE_DECORATORS`
 - ``forbidden-inline-ignore`` - list of codes of violations or
     class of violations that are forbidden to ignore inline, defaults to
     :str:`wemake_python_styleguide.options.defaults.FORBIDDEN_INLINE_IGNORE`
@@ -267,6 +270,13 @@ class Configuration:
             type=String,
             comma_separated_list=True,
         ),
+        _Option(
+            '--dataclass-like-decorators',
+            defaults.DATACLASS_LIKE_DECORATORS,
+            'Extra decorators that define dataclass-like classes.',
+            type=String,
+            comma_separated_list=True,
+        ),
         _Option(
             '--forbidden-inline-ignore',
             defaults.FORBIDDEN_INLINE_IGNORE,
@@ -52,6 +52,9 @@ ALLOWED_MODULE_METADATA: Final = ()
 #: List of module metadata we forbid to use.
 FORBIDDEN_MODULE_METADATA: Final = ()
 
+#: Extra decorators that define dataclass-like classes.
+DATACLASS_LIKE_DECORATORS: Final = ()
+
 # ===========
 # Complexity:
 # ===========
@@ -67,6 +67,7 @@ class ValidatedOptions:
     forbidden_domain_names: tuple[str, ...] = attr.ib(converter=tuple)
     allowed_module_metadata: tuple[str, ...] = attr.ib(converter=tuple)
     forbidden_module_metadata: tuple[str, ...] = attr.ib(converter=tuple)
+    dataclass_like_decorators: frozenset[str] = attr.ib(converter=frozenset)
     forbidden_inline_ignore: tuple[str, ...] = attr.ib(converter=tuple)
 
     # Complexity:
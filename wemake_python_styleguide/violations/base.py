@@ -79,8 +79,12 @@ class BaseViolation(abc.ABC):
     this error later on.
 
     Each subclass must define ``error_template`` and ``code`` fields.
+    All subclasses should also define empty ``__slots__``,
+    so violation instances do not have ``__dict__``.
     """
 
+    __slots__ = ('_baseline', '_node', '_text')
+
     error_template: ClassVar[str]
     code: ClassVar[int]
     disabled_since: ClassVar[str | None] = None
@@ -88,6 +92,7 @@ class BaseViolation(abc.ABC):
     # assigned in __init_subclass__
     full_code: ClassVar[str]
     summary: ClassVar[str]
+    _template_parts: ClassVar[tuple[str, str] | None]
 
     # We use this code to show base metrics and thresholds mostly:
     postfix_template: ClassVar[ViolationPostfixes] = (
@@ -107,6 +112,7 @@ class BaseViolation(abc.ABC):
         # this is mostly done for docs to display the full code,
         # allowing its indexing in search engines and better discoverability
         cls.full_code = cls._full_code()
+        cls._template_parts = _split_template(cls.error_template)
         cls.summary = cls.__doc__.lstrip().split('\n', maxsplit=1)[0]
         # this hack adds full code to summary table in the docs
         cls.__doc__ = _prepend_skipping_whitespaces(
@@ -140,7 +146,14 @@ class BaseViolation(abc.ABC):
 
         Conditionally formats the ``error_template`` if it is required.
         """
-        formatted = self.error_template.format(self._text)
+        if self._template_parts is None:
+            formatted = self.error_template.format(self._text)
+        else:
+            # Most templates have a single `{0}` placeholder, we don't
+            # need the whole formatting machinery to fill it in:
+            prefix, suffix = self._template_parts
+            formatted = f'{prefix}{self._text}{suffix}'
+
         if self._text and formatted == self.error_template:  # pragma: no cover
             raise ValueError('Error message was not formatted', self)
         return f'{self.full_code} {formatted}{self._postfix_information()}'
@@ -181,6 +194,8 @@ class BaseViolation(abc.ABC):
 class _BaseASTViolation(BaseViolation):
     """Used as a based type for all ``ast`` violations."""
 
+    __slots__ = ()
+
     _node: ast.AST | None
 
     @final
@@ -193,6 +208,8 @@ class _BaseASTViolation(BaseViolation):
 class ASTViolation(_BaseASTViolation):
     """Violation for ``ast`` based style visitors."""
 
+    __slots__ = ()
+
     _node: ast.AST
 
 
@@ -204,6 +221,8 @@ class MaybeASTViolation(_BaseASTViolation):
     Is wildly used for naming rules.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         node: ast.AST | None = None,
@@ -217,6 +236,8 @@ class MaybeASTViolation(_BaseASTViolation):
 class TokenizeViolation(BaseViolation):
     """Violation for ``tokenize`` based visitors."""
 
+    __slots__ = ()
+
     _node: tokenize.TokenInfo
 
     @final
@@ -227,6 +248,8 @@ class TokenizeViolation(BaseViolation):
 class SimpleViolation(BaseViolation):
     """Violation for cases where there's no associated nodes."""
 
+    __slots__ = ()
+
     _node: None
 
     def __init__(
@@ -249,6 +272,29 @@ class SimpleViolation(BaseViolation):
         return 0, 0
 
 
+def _split_template(error_template: str) -> tuple[str, str] | None:
+    """
+    Splits templates with a single ``{0}`` placeholder into two parts.
+
+    >>> _split_template('Found wrong name: {0}')
+    ('Found wrong name: ', '')
+
+    >>> _split_template('Found `{0}` usage')
+    ('Found `', '` usage')
+
+    >>> _split_template('Found nested `try` block') is None
+    True
+
+    >>> _split_template('Found {0}; used {0}') is None
+    True
+
+    """
+    prefix, placeholder, suffix = error_template.partition('{0}')
+    if not placeholder or '{' in prefix + suffix or '}' in prefix + suffix:
+        return None
+    return prefix, suffix
+
+
 def _prepend_skipping_whitespaces(prefix: str, text: str) -> str:
     lstripped_text = text.lstrip()
     leading_whitespaces = text[: len(text) - len(lstripped_text)]
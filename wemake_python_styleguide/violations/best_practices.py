@@ -66,6 +66,7 @@ class WrongMagicCommentViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     code = 400
     error_template = 'Found wrong magic comment: {0}'
 
@@ -99,6 +100,7 @@ class WrongDocCommentViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     code = 401
     error_template = 'Found wrong doc comment'
 
@@ -128,6 +130,7 @@ class OveruseOfNoqaCommentViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `noqa` comments overuse: {0}'
     code = 402
 
@@ -155,6 +158,7 @@ class OveruseOfNoCoverCommentViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `no cover` comments overuse: {0}'
     code = 403
 
@@ -188,6 +192,7 @@ class ComplexDefaultValueViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found complex default value'
     code = 404
 
@@ -221,6 +226,7 @@ class LoopVariableDefinitionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong `for` loop variable definition'
     code = 405
 
@@ -254,6 +260,7 @@ class ContextManagerVariableDefinitionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong context manager variable definition'
     code = 406
 
@@ -290,6 +297,7 @@ class MutableModuleConstantViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found mutable module constant'
     code = 407
 
@@ -323,6 +331,7 @@ class SameElementsInConditionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found duplicate logical condition'
     code = 408
 
@@ -363,6 +372,7 @@ class HeterogeneousCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found heterogeneous compare'
     code = 409
 
@@ -405,6 +415,7 @@ class WrongModuleMetadataViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong metadata variable: {0}'
     code = 410
 
@@ -427,6 +438,7 @@ class EmptyModuleViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found empty module'
     code = 411
 
@@ -461,6 +473,7 @@ class InitModuleHasLogicViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `__init__.py` module with logic'
     code = 412
 
@@ -481,6 +494,7 @@ class BadMagicModuleFunctionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found bad magic module function: {0}'
     code = 413
 
@@ -517,6 +531,7 @@ class WrongUnpackingViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect unpacking target'
     code = 414
 
@@ -560,6 +575,7 @@ class DuplicateExceptionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found duplicate exception: {0}'
     code = 415
     disabled_since = '1.0.0'
@@ -600,6 +616,7 @@ class YieldInComprehensionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `yield` inside comprehension'
     code = 416
     disabled_since = '0.18.0'
@@ -645,6 +662,7 @@ class NonUniqueItemsInHashViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found non-unique item in hash: {0}'
     code = 417
     disabled_since = '1.0.0'
@@ -682,6 +700,7 @@ class BaseExceptionSubclassViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found exception inherited from `BaseException`'
     code = 418
 
@@ -742,6 +761,7 @@ class TryExceptMultipleReturnPathViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `try`/`else`/`finally` with multiple return paths'
     code = 419
     disabled_since = '1.0.0'
@@ -781,6 +801,7 @@ class WrongKeywordViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong keyword: {0}'
     code = 420
 
@@ -806,6 +827,7 @@ class WrongFunctionCallViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong function call: {0}'
     code = 421
 
@@ -839,6 +861,7 @@ class FutureImportViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found future import: {0}'
     code = 422
 
@@ -875,6 +898,7 @@ class RaiseNotImplementedViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found raise NotImplemented'
     code = 423
     disabled_since = '1.0.0'
@@ -914,6 +938,7 @@ class BaseExceptionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found except `BaseException`'
     code = 424
     disabled_since = '1.0.0'
@@ -956,6 +981,7 @@ class BooleanPositionalArgumentViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found boolean non-keyword argument: {0}'
     code = 425
     disabled_since = '1.0.0'
@@ -997,6 +1023,7 @@ class LambdaInsideLoopViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = "Found `lambda` in loop's body"
     code = 426
 
@@ -1042,6 +1069,7 @@ class UnreachableCodeViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unreachable code'
     code = 427
 
@@ -1084,6 +1112,7 @@ class StatementHasNoEffectViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found statement that has no effect'
     code = 428
     disabled_since = '1.0.0'
@@ -1116,6 +1145,7 @@ class MultipleAssignmentsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found multiple assign targets'
     code = 429
 
@@ -1156,6 +1186,7 @@ class NestedFunctionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found nested function: {0}'
     code = 430
 
@@ -1196,6 +1227,7 @@ class NestedClassViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found nested class: {0}'
     code = 431
 
@@ -1241,6 +1273,7 @@ class MagicNumberViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 432
     error_template = 'Found magic number: {0}'
 
@@ -1281,6 +1314,7 @@ class NestedImportViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found nested import'
     code = 433
     disabled_since = '1.0.0'
@@ -1314,6 +1348,7 @@ class ReassigningVariableToItselfViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found reassigning variable to itself: {0}'
     code = 434
     disabled_since = '1.0.0'
@@ -1344,6 +1379,7 @@ class ListMultiplyViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found list multiply'
     code = 435
 
@@ -1384,6 +1420,7 @@ class ProtectedModuleViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found protected module import: {0}'
     code = 436
     disabled_since = '1.0.0'
@@ -1431,6 +1468,7 @@ class ProtectedAttributeViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found protected attribute usage: {0}'
     code = 437
     disabled_since = '1.0.0'
@@ -1468,6 +1506,7 @@ class StopIterationInsideGeneratorViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `StopIteration` raising inside generator'
     code = 438
 
@@ -1499,6 +1538,7 @@ class WrongUnicodeEscapeViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unicode escape in a binary string: {0}'
     code = 439
 
@@ -1548,6 +1588,7 @@ class BlockAndLocalOverlapViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found block variables overlap: {0}'
     code = 440
     disabled_since = '1.0.0'
@@ -1593,6 +1634,7 @@ class ControlVarUsedAfterBlockViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found control variable used after block: {0}'
     code = 441
 
@@ -1639,6 +1681,7 @@ class OuterScopeShadowingViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found outer scope names shadowing: {0}'
     code = 442
     disabled_since = '1.0.0'
@@ -1667,6 +1710,7 @@ class UnhashableTypeInHashViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unhashable item'
     code = 443
 
@@ -1710,6 +1754,7 @@ class WrongKeywordConditionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect keyword condition'
     code = 444
 
@@ -1738,6 +1783,7 @@ class WrongNamedKeywordViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 445
     error_template = 'Found incorrectly named keyword in the starred dict'
 
@@ -1777,6 +1823,7 @@ class ApproximateConstantViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 446
     error_template = 'Found approximate constant: {0}'
 
@@ -1811,6 +1858,7 @@ class StringConstantRedefinedViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found alphabet as strings: {0}'
     code = 447
 
@@ -1858,6 +1906,7 @@ class IncorrectExceptOrderViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect exception order'
     code = 448
 
@@ -1893,6 +1942,7 @@ class FloatKeyViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found float used as a key'
     code = 449
 
@@ -1929,6 +1979,7 @@ class ProtectedModuleMemberViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found protected object import: {0}'
     code = 450
     disabled_since = '1.0.0'
@@ -1970,6 +2021,7 @@ class PositionalOnlyArgumentsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found positional-only argument'
     code = 451
     disabled_since = '0.19.0'
@@ -2017,6 +2069,7 @@ class LoopControlFinallyViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `break` or `continue` in `finally` block'
     code = 452
     disabled_since = '1.0.0'
@@ -2054,6 +2107,7 @@ class ShebangViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found executable mismatch: {0}'
     code = 453
 
@@ -2093,6 +2147,7 @@ class BaseExceptionRaiseViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong `raise` exception type: {0}'
     code = 454
     disabled_since = '1.0.0'
@@ -2137,6 +2192,7 @@ class NonTrivialExceptViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found non-trivial expression as an argument for "except"'
     code = 455
 
@@ -2168,6 +2224,7 @@ class FloatingNanViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found "NaN" as argument to float()'
     code = 456
     disabled_since = '1.0.0'
@@ -2199,6 +2256,7 @@ class InfiniteWhileLoopViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found an infinite while loop'
     code = 457
 
@@ -2236,6 +2294,7 @@ class ImportCollisionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found imports collision: {0}'
     code = 458
 
@@ -2271,6 +2330,7 @@ class FloatComplexCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found comparison with float or complex number'
     code = 459
 
@@ -2298,6 +2358,7 @@ class SingleElementDestructuringViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found single element destructuring'
     code = 460
 
@@ -2326,6 +2387,7 @@ class ForbiddenInlineIgnoreViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Forbidden inline ignore: {0}'
     code = 461
 
@@ -2366,6 +2428,7 @@ class WrongMultilineStringUseViolation(TokenizeViolation):
 
     '''
 
+    __slots__ = ()
     error_template = 'Wrong multiline string usage'
     code = 462
 
@@ -2399,6 +2462,7 @@ class GetterWithoutReturnViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a getter without a return value'
     code = 463
 
@@ -2436,6 +2500,7 @@ class EmptyCommentViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found empty comment'
     code = 464
 
@@ -2470,6 +2535,7 @@ class BitwiseAndBooleanMixupViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found likely bitwise and boolean operation mixup'
     code = 465
     disabled_since = '1.0.0'
@@ -2517,6 +2583,7 @@ class NewStyledDecoratorViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found new-styled decorator'
     code = 466
 
@@ -2553,6 +2620,7 @@ class BareRaiseViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found bare raise keyword'
     code = 467
     disabled_since = '1.0.0'
@@ -2584,6 +2652,7 @@ class RedundantEnumerateViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found redundant use of `enumerate`'
     code = 468
 
@@ -2614,6 +2683,7 @@ class RaiseFromItselfViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found error raising from itself'
     code = 469
 
@@ -2646,6 +2716,7 @@ class KwargsUnpackingInClassDefinitionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found kwarg unpacking in class definition'
     code = 470
 
@@ -2674,6 +2745,7 @@ class ConsecutiveSlicesViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found consecutive slices'
     code = 471
 
@@ -2704,6 +2776,7 @@ class GettingElementByUnpackingViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = (
         'Found unpacking used to get a single element from a collection'
     )
@@ -2751,6 +2824,7 @@ class WrongEmptyLinesCountViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many empty lines in `def`: {0}'
     code = 473
 
@@ -2779,6 +2853,7 @@ class ImportObjectCollisionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found import object collision: {0}'
     code = 474
 
@@ -2814,6 +2889,7 @@ class ProblematicFunctionParamsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found problematic function parameters'
     code = 475
 
@@ -2849,6 +2925,7 @@ class AwaitInLoopViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `await` in `for` loop'
     code = 476
 
@@ -2884,6 +2961,7 @@ class SneakyTypeVarWithDefaultViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a TypeVarTuple following a TypeVar with default'
     code = 477
 
@@ -2914,6 +2992,7 @@ class NonStrictSliceOperationsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found non strict slice operation'
     code = 478
 
@@ -2944,6 +3023,7 @@ class MultilineFormattedStringViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found multi-line formatted string'
     code = 479
 
@@ -2975,5 +3055,6 @@ class CommentInFormattedStringViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found comment inside formatted string'
     code = 480
@@ -59,6 +59,7 @@ class JonesScoreViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found module with high Jones Complexity score: {0}'
     code = 200
 
@@ -99,6 +100,7 @@ class TooManyImportsViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found module with too many imports: {0}'
     code = 201
 
@@ -129,6 +131,7 @@ class TooManyModuleMembersViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many module members: {0}'
     code = 202
 
@@ -177,6 +180,7 @@ class TooManyImportedNamesViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found module with too many imported names: {0}'
     code = 203
 
@@ -220,6 +224,7 @@ class OverusedExpressionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found overused expression: {0}'
     code = 204
 
@@ -274,6 +279,7 @@ class TooManyLocalsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many local variables: {0}'
     code = 210
 
@@ -304,6 +310,7 @@ class TooManyArgumentsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many arguments: {0}'
     code = 211
 
@@ -329,6 +336,7 @@ class TooManyReturnsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many return statements: {0}'
     code = 212
 
@@ -364,6 +372,7 @@ class TooManyExpressionsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many expressions: {0}'
     code = 213
 
@@ -400,6 +409,7 @@ class TooManyMethodsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many methods: {0}'
     code = 214
 
@@ -447,6 +457,7 @@ class TooManyBaseClassesViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Too many base classes: {0}'
     code = 215
 
@@ -480,6 +491,7 @@ class TooManyDecoratorsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Too many decorators: {0}'
     code = 216
 
@@ -505,6 +517,7 @@ class TooManyAwaitsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many await expressions: {0}'
     code = 217
 
@@ -531,6 +544,7 @@ class TooManyAssertsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many `assert` statements: {0}'
     code = 218
 
@@ -583,6 +597,7 @@ class TooDeepAccessViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too deep access level: {0}'
     code = 219
 
@@ -608,6 +623,7 @@ class TooDeepNestingViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too deep nesting: {0}'
     code = 220
 
@@ -656,6 +672,7 @@ class LineComplexityViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found line with high Jones Complexity: {0}'
     code = 221
 
@@ -685,6 +702,7 @@ class TooManyConditionsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a condition with too much logic: {0}'
     code = 222
 
@@ -713,6 +731,7 @@ class TooManyElifsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many `elif` branches: {0}'
     code = 223
 
@@ -745,6 +764,7 @@ class TooManyForsInComprehensionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a comprehension with too many `for` statements'
     code = 224
 
@@ -777,6 +797,7 @@ class TooManyExceptCasesViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many `except` cases: {0}'
     code = 225
 
@@ -813,6 +834,7 @@ class OverusedStringViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found string literal over-use: {0}'
     code = 226
 
@@ -835,6 +857,7 @@ class TooLongOutputTupleViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too long function output tuple: {0}'
     code = 227
 
@@ -856,6 +879,7 @@ class TooLongCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too long compare: {0}'
     code = 228
 
@@ -890,6 +914,7 @@ class TooLongTryBodyViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too long ``try`` body length: {0}'
     code = 229
 
@@ -923,15 +948,24 @@ class TooManyPublicAttributesViolation(ASTViolation):
         Default:
         :str:`wemake_python_styleguide.options.defaults.MAX_ATTRIBUTES`
 
+        Extra dataclass-like decorators are configurable
+        with ``--dataclass-like-decorators``.
+        Default:
+        :str:`wemake_python_styleguide.options.defaults.DATACLASS_LIKE_DECORATORS`
+
     See also:
         https://en.wikipedia.org/wiki/Coupling_(computer_programming)
 
     .. versionadded:: 0.12.0
     .. versionchanged:: 1.0.0
        Any amount of attributes are allowed on ``@dataclasses``.
+    .. versionchanged:: 1.4.0
+       Any amount of attributes are allowed
+       with ``--dataclass-like-decorators``.
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many public instance attributes: {0}'
     code = 230
 
@@ -965,6 +999,7 @@ class CognitiveComplexityViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found function with too much cognitive complexity: {0}'
     code = 231
 
@@ -994,6 +1029,7 @@ class CognitiveModuleComplexityViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found module cognitive complexity that is too high: {0}'
     code = 232
 
@@ -1020,6 +1056,7 @@ class TooLongCallChainViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found call chain that is too long: {0}'
     code = 233
 
@@ -1053,6 +1090,7 @@ class TooComplexAnnotationViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found overly complex annotation: {0}'
     code = 234
 
@@ -1088,6 +1126,7 @@ class TooManyImportedModuleMembersViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many imported names from a module: {0}'
 
     code = 235
@@ -1122,6 +1161,7 @@ class TooLongTupleUnpackViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many variables used to unpack a tuple: {0}'
     code = 236
 
@@ -1163,6 +1203,7 @@ class TooComplexFormattedStringViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a too complex `f` string'
     code = 237
 
@@ -1191,6 +1232,7 @@ class TooManyRaisesViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many raises in a function: {0}'
     code = 238
 
@@ -1216,6 +1258,7 @@ class TooManyExceptExceptionsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many exceptions in `except` case: {0}'
     code = 239
 
@@ -1245,6 +1288,7 @@ class TooManyTypeParamsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many type params: {0}'
     code = 240
 
@@ -1273,6 +1317,7 @@ class TooManyMatchSubjectsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too many subjects in `match` statement: {0}'
     code = 241
 
@@ -1304,6 +1349,7 @@ class TooManyMatchCaseViolation(ASTViolation):
     .. versionadded:: 1.0.0
     """
 
+    __slots__ = ()
     error_template = 'Found too many cases in `match` block: {0}'
     code = 242
 
@@ -1339,5 +1385,6 @@ class TooLongFinallyBodyViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too long `finally` block: {0}'
     code = 243
@@ -52,6 +52,7 @@ class LocalFolderImportViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found local folder import'
     code = 300
 
@@ -81,6 +82,7 @@ class DottedRawImportViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found dotted raw import: {0}'
     code = 301
 
@@ -113,6 +115,7 @@ class UnicodeStringViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     code = 302
     error_template = 'Found unicode string prefix: {0}'
     disabled_since = '1.0.0'
@@ -155,6 +158,7 @@ class UnderscoredNumberViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     code = 303
     error_template = 'Found underscored number: {0}'
 
@@ -190,6 +194,7 @@ class PartialFloatViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     code = 304
     error_template = 'Found partial float: {0}'
     disabled_since = '1.0.0'
@@ -232,6 +237,7 @@ class FormattedStringViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `f` string'
     code = 305
     disabled_since = '1.0.0'
@@ -274,6 +280,7 @@ class ExplicitObjectBaseClassViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found explicit `object` base class: {0}'
     code = 306
     disabled_since = '1.0.0'
@@ -305,6 +312,7 @@ class MultipleIfsInComprehensionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a comprehension with multiple `if`s'
     code = 307
 
@@ -337,6 +345,7 @@ class ConstantCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found constant comparison'
     code = 308
 
@@ -370,6 +379,7 @@ class CompareOrderViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found reversed compare order'
     code = 309
     disabled_since = '1.0.0'
@@ -412,6 +422,7 @@ class BadNumberSuffixViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found bad number suffix: {0}'
     code = 310
     disabled_since = '1.0.0'
@@ -444,6 +455,7 @@ class MultipleInCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found multiple `in` compares'
     code = 311
 
@@ -479,6 +491,7 @@ class UselessCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found comparison of a variable to itself'
     code = 312
     disabled_since = '1.0.1'
@@ -518,6 +531,7 @@ class MissingSpaceBetweenKeywordAndParenViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found parenthesis immediately after a keyword'
     code = 313
     disabled_since = '1.0.0'
@@ -553,6 +567,7 @@ class ConstantConditionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found conditional that always evaluates the same'
     code = 314
 
@@ -587,6 +602,7 @@ class ObjectInBaseClassesListViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found extra `object` in parent classes list: {0}'
     code = 315
     disabled_since = '1.0.0'
@@ -625,6 +641,7 @@ class MultipleContextManagerAssignmentsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found context manager with too many assignments'
     code = 316
     disabled_since = '1.0.0'
@@ -705,6 +722,7 @@ class ParametersIndentationViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect multi-line parameters'
     code = 317
     disabled_since = '1.0.0'
@@ -750,6 +768,7 @@ class ExtraIndentationViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found extra indentation'
     code = 318
     disabled_since = '1.0.0'
@@ -807,6 +826,7 @@ class WrongBracketPositionViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found bracket in wrong position'
     code = 319
     disabled_since = '1.0.0'
@@ -845,6 +865,7 @@ class MultilineFunctionAnnotationViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found multi-line function type annotation'
     code = 320
     disabled_since = '1.0.0'
@@ -875,6 +896,7 @@ class UppercaseStringModifierViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found uppercase string modifier: {0}'
     code = 321
 
@@ -918,6 +940,7 @@ class UselessMultilineStringViolation(TokenizeViolation):
 
     '''
 
+    __slots__ = ()
     error_template = 'Found incorrect multi-line string'
     code = 322
 
@@ -970,6 +993,7 @@ class ModuloStringFormatViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `%` string formatting'
     code = 323
     disabled_since = '1.0.0'
@@ -1016,6 +1040,7 @@ class InconsistentReturnViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found inconsistent `return` statement'
     code = 324
 
@@ -1059,6 +1084,7 @@ class InconsistentYieldViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found inconsistent `yield` statement'
     code = 325
 
@@ -1092,6 +1118,7 @@ class ImplicitStringConcatenationViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit string concatenation'
     code = 326
     disabled_since = '1.0.0'
@@ -1137,6 +1164,7 @@ class UselessContinueViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless `continue` at the end of the loop'
     code = 327
 
@@ -1165,6 +1193,7 @@ class UselessNodeViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless node: {0}'
     code = 328
 
@@ -1210,6 +1239,7 @@ class UselessExceptCaseViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless `except` case'
     code = 329
     disabled_since = '1.0.0'
@@ -1249,6 +1279,7 @@ class UselessOperatorsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 330
     error_template = 'Found unnecessary operator: {0}'
 
@@ -1298,6 +1329,7 @@ class InconsistentReturnVariableViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found variables that are only used for `return`: {0}'
     code = 331
     disabled_since = '1.0.0'
@@ -1335,6 +1367,7 @@ class WalrusViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found walrus operator outside a comprehension'
     code = 332
 
@@ -1369,6 +1402,7 @@ class ImplicitComplexCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 333
     error_template = 'Found implicit complex compare'
     disabled_since = '1.0.0'
@@ -1403,6 +1437,7 @@ class ReversedComplexCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 334
     error_template = 'Found reversed complex comparison'
 
@@ -1445,6 +1480,7 @@ class WrongLoopIterTypeViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 335
     error_template = 'Found incorrect `for` loop iter type'
 
@@ -1477,6 +1513,7 @@ class ExplicitStringConcatViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 336
     error_template = 'Found explicit string concatenation'
 
@@ -1515,6 +1552,7 @@ class MultilineConditionsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found multiline conditions'
     code = 337
     disabled_since = '1.0.0'
@@ -1550,6 +1588,7 @@ class WrongMethodOrderViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect order of methods in a class'
     code = 338
 
@@ -1585,6 +1624,7 @@ class NumberWithMeaninglessZeroViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found number with meaningless zeros: {0}'
     code = 339
 
@@ -1617,6 +1657,7 @@ class PositiveExponentViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found exponent number with positive exponent: {0}'
     code = 340
     disabled_since = '1.0.0'
@@ -1649,6 +1690,7 @@ class WrongHexNumberCaseViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong hex number case: {0}'
     code = 341
     disabled_since = '1.0.0'
@@ -1681,6 +1723,7 @@ class ImplicitRawStringViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit raw string: {0}'
     code = 342
 
@@ -1711,6 +1754,7 @@ class BadComplexNumberSuffixViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong complex number suffix: {0}'
     code = 343
     disabled_since = '1.0.0'
@@ -1744,6 +1788,7 @@ class ZeroDivisionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found explicit zero division'
     code = 344
 
@@ -1786,6 +1831,7 @@ class MeaninglessNumberOperationViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found meaningless number operation'
     code = 345
 
@@ -1821,6 +1867,7 @@ class OperationSignNegationViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong operation sign'
     code = 346
 
@@ -1864,6 +1911,7 @@ class VagueImportViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found vague import that may cause confusion: {0}'
     code = 347
 
@@ -1906,6 +1954,7 @@ class LineStartsWithDotViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found a line that starts with a dot'
     code = 348
     disabled_since = '1.0.0'
@@ -1933,6 +1982,7 @@ class RedundantSubscriptViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found redundant subscript slice'
     code = 349
 
@@ -1958,6 +2008,7 @@ class AugmentedAssignPatternViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found usable augmented assign pattern'
     code = 350
 
@@ -1989,6 +2040,7 @@ class UnnecessaryLiteralsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unnecessary literals'
     code = 351
     disabled_since = '1.0.0'
@@ -2026,6 +2078,7 @@ class MultilineLoopViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found multiline loop'
     code = 352
     disabled_since = '1.0.0'
@@ -2061,6 +2114,7 @@ class IncorrectYieldFromTargetViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect `yield from` target'
     code = 353
 
@@ -2084,6 +2138,7 @@ class ConsecutiveYieldsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found consecutive `yield` expressions'
     code = 354
 
@@ -2122,6 +2177,7 @@ class BracketBlankLineViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found an unnecessary blank line before a bracket'
     code = 355
     disabled_since = '1.0.0'
@@ -2158,6 +2214,7 @@ class IterableUnpackingViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found an unnecessary iterable unpacking'
     code = 356
 
@@ -2179,6 +2236,7 @@ class LineCompriseCarriageReturnViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = r'Found a ``\r`` (carriage return) line break'
     code = 357
 
@@ -2209,6 +2267,7 @@ class FloatZeroViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     code = 358
     error_template = 'Found a float zero (0.0)'
 
@@ -2238,6 +2297,7 @@ class UnpackingIterableToListViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found an iterable unpacking to list'
     code = 359
 
@@ -2270,6 +2330,7 @@ class RawStringNotNeededViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found an unnecessary use of a raw string: {0}'
     code = 360
     disabled_since = '1.0.0'
@@ -2312,6 +2373,7 @@ class InconsistentComprehensionViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found an inconsistently structured comprehension'
     code = 361
     disabled_since = '1.0.0'
@@ -2352,6 +2414,7 @@ class AssignToSliceViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found assignment to a subscript slice'
     code = 362
 
@@ -2379,5 +2442,6 @@ class RaiseSystemExitViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `raise SystemExit`, instead of using `sys.exit`'
     code = 363
@@ -165,6 +165,7 @@ class WrongModuleNameViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong module name'
     code = 100
 
@@ -195,6 +196,7 @@ class WrongModuleMagicNameViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong module magic name'
     code = 101
 
@@ -230,6 +232,7 @@ class WrongModuleNamePatternViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect module name pattern'
     code = 102
 
@@ -279,6 +282,7 @@ class WrongVariableNameViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong variable name: {0}'
     code = 110
 
@@ -325,6 +329,7 @@ class TooShortNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too short name: {0}'
     code = 111
     postfix_template = ViolationPostfixes.less_than
@@ -361,6 +366,7 @@ class PrivateNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found private name pattern: {0}'
     code = 112
 
@@ -390,6 +396,7 @@ class SameAliasImportViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found same alias import: {0}'
     code = 113
     disabled_since = '1.0.0'
@@ -428,6 +435,7 @@ class UnderscoredNumberNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found underscored number name pattern: {0}'
     code = 114
 
@@ -468,6 +476,7 @@ class UpperCaseAttributeViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found upper-case constant in a class: {0}'
     code = 115
 
@@ -497,6 +506,7 @@ class ConsecutiveUnderscoresInNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found consecutive underscores name: {0}'
     code = 116
 
@@ -528,6 +538,7 @@ class ReservedArgumentNameViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found name reserved for first argument: {0}'
     code = 117
 
@@ -568,6 +579,7 @@ class TooLongNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found too long name: {0}'
     code = 118
 
@@ -602,6 +614,7 @@ class UnicodeNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unicode name: {0}'
     code = 119
 
@@ -635,6 +648,7 @@ class TrailingUnderscoreViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found regular name with trailing underscore: {0}'
     code = 120
 
@@ -682,6 +696,7 @@ class UnusedVariableIsUsedViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found usage of a variable marked as unused: {0}'
     code = 121
 
@@ -718,6 +733,7 @@ class UnusedVariableIsDefinedViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found all unused variables definition: {0}'
     code = 122
 
@@ -749,6 +765,7 @@ class WrongUnusedVariableNameViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong unused variable name: {0}'
     code = 123
 
@@ -786,6 +803,7 @@ class UnreadableNameViolation(MaybeASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unreadable characters combination: {0}'
     code = 124
 
@@ -829,6 +847,7 @@ class BuiltinShadowingViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found builtin shadowing: {0}'
     code = 125
     disabled_since = '1.0.0'
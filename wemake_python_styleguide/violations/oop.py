@@ -49,6 +49,7 @@ class BuiltinSubclassViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found subclassing a builtin: {0}'
     code = 600
 
@@ -74,6 +75,13 @@ class ShadowedClassAttributeViolation(ASTViolation):
     in parent classes. That's where ``ClassVar`` is required for ``mypy``
     to check it for you.
 
+    Configuration:
+        Dataclasses are allowed to shadow attributes.
+        Extra dataclass-like decorators are configurable
+        with ``--dataclass-like-decorators``.
+        Default:
+        :str:`wemake_python_styleguide.options.defaults.DATACLASS_LIKE_DECORATORS`
+
     Example::
 
         # Correct:
@@ -100,11 +108,15 @@ class ShadowedClassAttributeViolation(ASTViolation):
     .. versionchanged:: 0.14.0
     .. versionchanged:: 1.0.0
        Allow to shadow class attribute names in ``@dataclass`` classes.
+    .. versionchanged:: 1.4.0
+       Allow to shadow attributes in classes
+       with ``--dataclass-like-decorators``.
 
     .. _mypyc: https://github.com/python/mypy/tree/master/mypyc
 
     """
 
+    __slots__ = ()
     error_template = 'Found shadowed class attribute: {0}'
     code = 601
 
@@ -126,6 +138,7 @@ class StaticMethodViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found using `@staticmethod`'
     code = 602
 
@@ -156,6 +169,7 @@ class BadMagicMethodViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found using restricted magic method: {0}'
     code = 603
 
@@ -192,6 +206,7 @@ class WrongClassBodyContentViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect node inside `class` body'
     code = 604
 
@@ -229,6 +244,7 @@ class MethodWithoutArgumentsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found method without arguments: {0}'
     code = 605
 
@@ -266,6 +282,7 @@ class WrongBaseClassViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect base class'
     code = 606
 
@@ -313,6 +330,7 @@ class WrongSlotsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect `__slots__` syntax'
     code = 607
 
@@ -344,6 +362,7 @@ class WrongSuperCallViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect `super()` call: {0}'
     code = 608
 
@@ -384,6 +403,7 @@ class DirectMagicAttributeAccessViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found direct magic attribute usage: {0}'
     code = 609
     disabled_since = '1.0.0'
@@ -426,6 +446,7 @@ class AsyncMagicMethodViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found forbidden `async` magic method usage: {0}'
     code = 610
 
@@ -472,6 +493,7 @@ class YieldMagicMethodViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found forbidden `yield` magic method usage: {0}'
     code = 611
 
@@ -511,6 +533,7 @@ class UselessOverwrittenMethodViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless overwritten method: {0}'
     code = 612
 
@@ -545,6 +568,7 @@ class WrongSuperCallAccessViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = (
         'Found incorrect `super()` call context: incorrect name access'
     )
@@ -585,6 +609,7 @@ class WrongDescriptorDecoratorViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found descriptor applied on a function'
     code = 614
 
@@ -623,6 +648,7 @@ class UnpythonicGetterSetterViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found unpythonic getter or setter: {0}'
     code = 615
 
@@ -654,6 +680,7 @@ class BuggySuperContextViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect form of `super()` call for the context'
     code = 616
 
@@ -688,5 +715,6 @@ class LambdaAttributeAssignedViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found lambda assigned as an attribute'
     code = 617
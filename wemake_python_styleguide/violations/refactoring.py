@@ -58,6 +58,7 @@ class UselessLoopElseViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `else` in a loop without `break`'
     code = 500
 
@@ -98,6 +99,7 @@ class UselessFinallyViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `finally` in `try` block without `except`'
     code = 501
 
@@ -136,6 +138,7 @@ class SimplifiableIfViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found simplifiable `if` condition'
     code = 502
     disabled_since = '1.0.0'
@@ -184,6 +187,7 @@ class UselessReturningElseViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless returning `else` statement'
     code = 503
     disabled_since = '1.0.0'
@@ -232,6 +236,7 @@ class NegatedConditionsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found negated condition'
     code = 504
 
@@ -281,6 +286,7 @@ class NestedTryViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found nested `try` block'
     code = 505
 
@@ -312,6 +318,7 @@ class UselessLambdaViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless lambda declaration'
     code = 506
 
@@ -350,6 +357,7 @@ class UselessLenCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless `len()` compare'
     code = 507
     disabled_since = '1.0.0'
@@ -385,6 +393,7 @@ class NotOperatorWithCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrect `not` with compare usage'
     code = 508
     disabled_since = '1.0.0'
@@ -423,6 +432,7 @@ class NestedTernaryViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrectly nested ternary'
     code = 509
 
@@ -464,6 +474,7 @@ class WrongInCompareTypeViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `in` used with a non-set container'
     code = 510
     disabled_since = '1.0.0'
@@ -501,6 +512,7 @@ class UnmergedIsinstanceCallsViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = (
         'Found separate `isinstance` calls that can be merged for: {0}'
     )
@@ -539,6 +551,7 @@ class WrongIsinstanceWithTupleViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `isinstance` call with a single element tuple'
     code = 512
     disabled_since = '1.0.0'
@@ -575,6 +588,7 @@ class ImplicitElifViolation(TokenizeViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit `elif` condition'
     code = 513
 
@@ -611,6 +625,7 @@ class ImplicitInConditionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 514
     error_template = 'Found implicit `in` condition: {0}'
     disabled_since = '1.0.0'
@@ -643,6 +658,7 @@ class OpenWithoutContextManagerViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 515
     error_template = 'Found `open()` used without a context manager'
 
@@ -676,6 +692,7 @@ class TypeCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 516
     error_template = 'Found `type()` used to compare types'
 
@@ -710,6 +727,7 @@ class PointlessStarredViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 517
     error_template = 'Found pointless starred expression'
 
@@ -743,6 +761,7 @@ class ImplicitEnumerateViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 518
     error_template = 'Found implicit `enumerate()` call'
 
@@ -783,6 +802,7 @@ class ImplicitSumViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 519
     error_template = 'Found implicit `sum()` call'
 
@@ -826,6 +846,7 @@ class FalsyConstantCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 520
     error_template = 'Found compare with falsy constant'
 
@@ -866,6 +887,7 @@ class WrongIsCompareViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 521
     error_template = 'Found wrong `is` compare'
     disabled_since = '1.0.0'
@@ -897,6 +919,7 @@ class ImplicitPrimitiveViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     code = 522
     error_template = 'Found implicit primitive in a form of `lambda`'
 
@@ -931,6 +954,7 @@ class AlmostSwappedViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found incorrectly swapped variables'
     code = 523
 
@@ -964,6 +988,7 @@ class MisrefactoredAssignmentViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found self assignment  with refactored assignment'
     code = 524
 
@@ -995,6 +1020,7 @@ class InCompareWithSingleItemContainerViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found wrong `in` compare with single item container'
     code = 525
     disabled_since = '1.0.0'
@@ -1036,6 +1062,7 @@ class ImplicitYieldFromViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit `yield from` usage'
     code = 526
     disabled_since = '1.0.0'
@@ -1069,6 +1096,7 @@ class NotATupleArgumentViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found not a tuple used as an argument'
     code = 527
 
@@ -1104,6 +1132,7 @@ class ImplicitItemsIteratorViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit `.items()` usage'
     code = 528
     disabled_since = '1.0.0'
@@ -1138,6 +1167,7 @@ class ImplicitDictGetViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit `.get()` dict usage'
     code = 529
 
@@ -1167,6 +1197,7 @@ class ImplicitNegativeIndexViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found implicit negative index'
     code = 530
 
@@ -1205,6 +1236,7 @@ class SimplifiableReturningIfViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found simplifiable returning `if` condition in a function'
     code = 531
     disabled_since = '1.0.0'
@@ -1234,6 +1266,7 @@ class ChainedIsViolation(ASTViolation):
     .. versionadded:: 0.18.0
     """
 
+    __slots__ = ()
     error_template = 'Found chained `is` operators in an expression'
     code = 532
 
@@ -1268,6 +1301,7 @@ class DuplicateIfConditionViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found duplicate condition in `if`: {0}'
     code = 533
 
@@ -1297,6 +1331,7 @@ class UselessTernaryViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found useless ternary expression'
     code = 534
 
@@ -1329,6 +1364,7 @@ class DuplicateCasePatternViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found duplicate `case` pattern: {0}'
     code = 535
 
@@ -1362,5 +1398,6 @@ class ExtraMatchSubjectSyntaxViolation(ASTViolation):
 
     """
 
+    __slots__ = ()
     error_template = 'Found `match` subject with extra syntax: {0}'
     code = 536
@@ -29,6 +29,7 @@ class InternalErrorViolation(SimpleViolation):
 
     """
 
+    __slots__ = ()
     error_template = (
         'Internal error happened, see log. Please, take some time to report it'
     )
@@ -30,27 +30,34 @@ class ClassAttributeVisitor(base.BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_attributes_shadowing(self, node: ast.ClassDef) -> None:
-        if classes.is_dataclass(node):
+        if classes.is_dataclass(
+            node,
+            extra_decorators=self.options.dataclass_like_decorators,
+        ):
             # dataclasses by its nature allow class-level attributes
             # shadowing from instance level.
             return
 
+        # Attributes of nested classes are not ours, they can't shadow ours:
         class_attributes, instance_attributes = classes.get_attributes(
             node,
             include_annotated=False,
+            skip_nested=True,
         )
-        class_attribute_names = set(
+        class_attribute_names = frozenset(
             name_nodes.flat_variable_names(class_attributes),
         )
-
-        for instance_attr in instance_attributes:
-            if instance_attr.attr in class_attribute_names:
-                self.add_violation(
-                    oop.ShadowedClassAttributeViolation(
-                        instance_attr,
-                        text=instance_attr.attr,
-                    ),
-                )
+        if not class_attribute_names:
+            return  # nothing can be shadowed
+
+        self.add_violations(
+            oop.ShadowedClassAttributeViolation(
+                instance_attr,
+                text=instance_attr.attr,
+            )
+            for instance_attr in instance_attributes
+            if instance_attr.attr in class_attribute_names
+        )
 
     def _check_lambda_attribute(self, node: ast.Lambda) -> None:
         assigned = walk.get_closest_parent(node, AssignNodes)
@@ -1,4 +1,6 @@
 import ast
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import ClassVar, final
 
 from wemake_python_styleguide import constants, types
@@ -152,6 +154,15 @@ class WrongMethodVisitor(base.BaseNodeVisitor):
 class ClassMethodOrderVisitor(base.BaseNodeVisitor):
     """Checks that all methods inside the class are ordered correctly."""
 
+    _base_methods_order: ClassVar[Mapping[str, int]] = MappingProxyType({
+        '__init_subclass__': 7,  # highest priority
+        '__new__': 6,
+        '__init__': 5,
+        '__call__': 4,
+        '__await__': 3,
+    })
+    _public_and_magic_methods_priority: ClassVar[int] = 2
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Ensures that class has correct methods order."""
         self._check_method_order(node)
@@ -178,20 +189,14 @@ class ClassMethodOrderVisitor(base.BaseNodeVisitor):
                 return
 
     def _ideal_order(self, first: str) -> int:
-        base_methods_order = {
-            '__init_subclass__': 7,  # highest priority
-            '__new__': 6,
-            '__init__': 5,
-            '__call__': 4,
-            '__await__': 3,
-        }
-        public_and_magic_methods_priority = 2
-
         if access.is_protected(first):
             return 1
         if access.is_private(first):
             return 0  # lowest priority
-        return base_methods_order.get(first, public_and_magic_methods_priority)
+        return self._base_methods_order.get(
+            first,
+            self._public_and_magic_methods_priority,
+        )
 
 
 @final
@@ -52,7 +52,10 @@ class ClassComplexityVisitor(BaseNodeVisitor):
             )
 
     def _check_public_attributes(self, node: ast.ClassDef) -> None:
-        if classes.is_dataclass(node):
+        if classes.is_dataclass(
+            node,
+            extra_decorators=self.options.dataclass_like_decorators,
+        ):
             return  # dataclasses can have any amount of attributes
 
         _, instance_attributes = classes.get_attributes(
@@ -99,12 +102,13 @@ class MethodMembersVisitor(BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_method(self, node: AnyFunctionDef) -> None:
+        parent = get_parent(node)
+        if not isinstance(parent, ast.ClassDef):
+            return
+
         if decorators.has_overload_decorator(node):
             return  # we don't count `@overload` methods
-
-        parent = get_parent(node)
-        if isinstance(parent, ast.ClassDef):
-            self._methods[parent] += 1
+        self._methods[parent] += 1
 
     def _post_visit(self) -> None:
         for node, count in self._methods.items():
@@ -92,11 +92,13 @@ class ConditionsVisitor(BaseNodeVisitor):
 
     def _count_conditions(self, node: ast.BoolOp) -> int:
         counter = 0
-        for condition in node.values:
-            if isinstance(condition, ast.BoolOp):
-                counter += self._count_conditions(condition)
-            else:
-                counter += 1
+        bool_ops = [node]
+        while bool_ops:
+            for condition in bool_ops.pop().values:
+                if isinstance(condition, ast.BoolOp):
+                    bool_ops.append(condition)
+                else:
+                    counter += 1
         return counter
 
     def _check_conditions(self, node: ast.BoolOp) -> None:
@@ -111,6 +113,9 @@ class ConditionsVisitor(BaseNodeVisitor):
             )
 
     def _check_compares(self, node: ast.Compare) -> None:
+        if len(node.ops) <= constants.MAX_COMPARES:
+            return  # short compares are fine with any operators
+
         is_all_equals = all(isinstance(op, ast.Eq) for op in node.ops)
         is_all_notequals = all(isinstance(op, ast.NotEq) for op in node.ops)
         can_be_longer = is_all_notequals or is_all_equals
@@ -136,9 +141,10 @@ class ElifVisitor(BaseNodeVisitor):
     def __init__(self, *args, **kwargs) -> None:
         """Creates internal ``elif`` counter."""
         super().__init__(*args, **kwargs)
-        self._if_children: defaultdict[ast.If, list[ast.If]] = defaultdict(
-            list,
+        self._if_children: defaultdict[ast.If, set[ast.If]] = defaultdict(
+            set,
         )
+        self._if_roots: dict[ast.If, ast.If] = {}
 
     def visit_If(self, node: ast.If) -> None:
         """Checks condition not to reimplement switch."""
@@ -146,18 +152,19 @@ class ElifVisitor(BaseNodeVisitor):
         self.generic_visit(node)
 
     def _get_root_if_node(self, node: ast.If) -> ast.If:
-        for root, children in self._if_children.items():
-            if node in children:
-                return root
-        return node
+        return self._if_roots.get(node, node)
 
     def _update_if_child(self, root: ast.If, node: ast.If) -> None:
-        if node is not root:
-            self._if_children[root].append(node)
-        self._if_children[root].extend(node.orelse)  # type: ignore
+        # `node` itself is already a child of `root`, unless it is `root`:
+        elifs: list[ast.If] = node.orelse  # type: ignore[assignment]
+        self._if_children[root].update(elifs)
+        self._if_roots.update(dict.fromkeys(elifs, root))
 
     def _check_elifs(self, node: ast.If) -> None:
-        has_elif = all(isinstance(if_node, ast.If) for if_node in node.orelse)
+        # Plain `if` nodes without `else` do not add any children:
+        has_elif = bool(node.orelse) and all(
+            isinstance(if_node, ast.If) for if_node in node.orelse
+        )
 
         if has_elif:
             root = self._get_root_if_node(node)
@@ -165,12 +172,11 @@ class ElifVisitor(BaseNodeVisitor):
 
     def _post_visit(self) -> None:
         for root, children in self._if_children.items():
-            real_children_length = len(set(children))
-            if real_children_length > constants.MAX_ELIFS:
+            if len(children) > constants.MAX_ELIFS:
                 self.add_violation(
                     complexity.TooManyElifsViolation(
                         root,
-                        text=str(real_children_length),
+                        text=str(len(children)),
                         baseline=constants.MAX_ELIFS,
                     ),
                 )
@@ -318,12 +324,14 @@ class TypeParamsVisitor(BaseNodeVisitor):  # pragma: >=3.12 cover
         self,
         node: _WithTypeParams,
     ) -> None:
-        type_params = getattr(node, 'type_params', [])
-        if len(type_params) > self.options.max_type_params:
+        # This visitor also runs on python3.10 and 3.11,
+        # where there are no `type_params` on these nodes:
+        type_params_count = len(getattr(node, 'type_params', ()))
+        if type_params_count > self.options.max_type_params:
             self.add_violation(
                 complexity.TooManyTypeParamsViolation(
                     node,
-                    text=str(len(type_params)),
+                    text=str(type_params_count),
                     baseline=self.options.max_type_params,
                 )
             )
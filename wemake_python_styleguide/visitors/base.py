@@ -52,6 +52,14 @@ We follow these conventions:
 - We try to separate as much logic from ``visit_`` methods as possible,
   so they only route for callbacks that actually execute the checks
 - We place repeating logic into ``logic/`` package to be able to reuse it
+- ``visit_`` handlers are looked up on a visitor class, not on an instance,
+  so they can't be added or replaced on visitor instances
+- Child nodes without handlers are walked by ``generic_visit()`` directly,
+  they are not passed to ``self.visit()``.
+  Redefine ``visit()`` or ``generic_visit()`` to see every node
+- The :term:`checker` does not create ``ast`` visitors
+  that have no handlers for any node of the checked tree,
+  unless they redefine ``visit()``, ``generic_visit()``, or ``_post_visit()``
 
 There are different examples of visitors in this project already.
 
@@ -63,12 +71,19 @@ Reference
 import abc
 import ast
 import tokenize
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from functools import cache
 from typing import final
 
 from wemake_python_styleguide import constants
-from wemake_python_styleguide.compat.routing import route_visit
+from wemake_python_styleguide.compat.routing import (
+    get_route_method,
+    route_visit,
+)
 from wemake_python_styleguide.logic.filenames import get_stem
+from wemake_python_styleguide.logic.tokens.routing import (
+    get_token_route_method,
+)
 from wemake_python_styleguide.options.validation import ValidatedOptions
 from wemake_python_styleguide.violations.base import BaseViolation
 
@@ -112,6 +127,16 @@ class BaseVisitor(abc.ABC):
         """
         return cls(options=checker.options, filename=checker.filename)
 
+    @classmethod
+    def is_applicable(cls, checker) -> bool:
+        """
+        Tells whether this visitor can find anything for the :term:`checker`.
+
+        Visitors that are not applicable are not constructed and not run.
+        By default all visitors are applicable.
+        """
+        return True
+
     @final
     def add_violation(self, violation: BaseViolation) -> None:
         """Adds violation to the visitor."""
@@ -119,6 +144,19 @@ class BaseVisitor(abc.ABC):
         assert violation.disabled_since is None, violation.code  # noqa: S101
         self.violations.append(violation)
 
+    @final
+    def add_violations(self, violations: Iterable[BaseViolation]) -> None:
+        """
+        Adds several violations to the visitor at once.
+
+        Useful when a single check produces violations in a loop.
+        """
+        new_violations = list(violations)
+        for violation in new_violations:
+            # It is not allowed to add disabled violations:
+            assert violation.disabled_since is None, violation.code  # noqa: S101
+        self.violations.extend(new_violations)
+
     @abc.abstractmethod
     def run(self) -> None:
         """
@@ -172,6 +210,21 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
             tree=checker.tree,
         )
 
+    @final
+    @classmethod
+    def is_applicable(cls, checker) -> bool:
+        """
+        Tells whether any node from the checked tree is routed to this visitor.
+
+        The :term:`checker` collects all route names of its tree in one pass.
+        Visitors that do not handle any of them would just walk
+        the whole tree without doing anything, so we skip them.
+        """
+        handled_routes = _get_handled_routes(cls)
+        return handled_routes is None or not handled_routes.isdisjoint(
+            checker.tree_routes,
+        )
+
     def visit(self, tree: ast.AST) -> None:
         """
         Visits a node.
@@ -186,6 +239,36 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
         """
         return route_visit(self, tree)
 
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+        Visits all children of a node.
+
+        Modified version of :class:`ast.NodeVisitor.generic_visit` method.
+        Children without ``visit_`` handlers are not visited recursively,
+        we traverse them with an explicit stack instead.
+        So, we do not create extra python frames for most of the nodes.
+
+        The order of visited nodes is the same.
+        Visitors that redefine ``visit()`` or ``generic_visit()``
+        still get their methods called for every node.
+        """
+        if not _has_default_routing(type(self)):
+            super().generic_visit(node)
+            return
+
+        nodes_to_visit = list(ast.iter_child_nodes(node))
+        nodes_to_visit.reverse()
+        while nodes_to_visit:
+            subnode = nodes_to_visit.pop()
+            route_method = get_route_method(self, subnode)
+            if route_method is not None:
+                route_method(self, subnode)
+                continue
+
+            subnodes = list(ast.iter_child_nodes(subnode))
+            subnodes.reverse()
+            nodes_to_visit.extend(subnodes)
+
     @final
     def run(self) -> None:
         """Recursively visits all ``ast`` nodes. Then executes post hook."""
@@ -266,15 +349,16 @@ class BaseTokenVisitor(BaseVisitor):
         Does nothing if handler for any token type is not defined.
 
         Inspired by ``NodeVisitor`` class.
+        Handlers are looked up once per visitor class and token type.
 
         See also:
             https://docs.python.org/3/library/tokenize.html
 
         """
-        token_type = tokenize.tok_name[token.exact_type].lower()
-        method = getattr(self, f'visit_{token_type}', None)
+        visitor_class: type = type(self)
+        method = get_token_route_method(visitor_class, token.exact_type)
         if method is not None:
-            method(token)
+            method(self, token)
 
     @final
     def run(self) -> None:
@@ -328,3 +412,37 @@ class BaseNodeTokenVisitor(ast.NodeVisitor, BaseVisitor):
     def _create_token_dict(self) -> None:
         """Create a token dict."""
         self._token_dict = {token.start: token for token in self.file_tokens}
+
+
+@cache
+def _has_default_routing(visitor_class: type[BaseNodeVisitor]) -> bool:
+    """Tells whether visitor does not redefine how nodes are routed."""
+    return (
+        visitor_class.visit is BaseNodeVisitor.visit
+        and visitor_class.generic_visit is BaseNodeVisitor.generic_visit
+    )
+
+
+@cache
+def _get_handled_routes(
+    visitor_class: type[BaseNodeVisitor],
+) -> frozenset[str] | None:
+    """
+    Returns all route names that have ``visit_`` handlers.
+
+    Returns ``None`` for visitors that have to see every node:
+    ones that redefine ``visit()`` or ``generic_visit()``
+    and ones with the post hook.
+    """
+    if (
+        not _has_default_routing(visitor_class)
+        or visitor_class._post_visit  # noqa: SLF001
+        is not BaseVisitor._post_visit  # noqa: SLF001
+    ):
+        return None
+    return frozenset(
+        attribute_name.removeprefix('visit_')
+        for klass in visitor_class.__mro__
+        for attribute_name in klass.__dict__
+        if attribute_name.startswith('visit_')
+    )